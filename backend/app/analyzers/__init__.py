@@ -0,0 +1,2 @@
+# Issues collected per category; beyond this a category's score is already zero
+MAX_ISSUES = 10
@@ -1,193 +1,303 @@
+import bisect
 import re
-from typing import List, Dict, Any
+from collections import Counter
+from itertools import islice
+from typing import Dict, Any, Iterator
+
+from . import MAX_ISSUES
+
+# Prefer RE2 when available: it matches in linear time, so crafted uploads cannot trigger
+# catastrophic backtracking. None of the patterns below need features RE2 lacks.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Precompiled patterns, shared across calls
+_FUNC_DEF = _regex.compile(r'function\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(')
+_ARROW = _regex.compile(r'const\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\(')
+_COMPONENT = _regex.compile(r'const\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\(?\{\s*\)?\s*=>')
+_VAR_DECL = _regex.compile(r'(?:const|let|var)\s+([A-Za-z_][A-Za-z0-9_]*)')
+_COMMENTED = _regex.compile(r'//\s*[^\s]')
+
+# Scoring categories with their base scores and per-issue penalties
+CATEGORIES = ("naming", "modularity", "comments", "formatting", "reusability", "best_practices")
+BASE_SCORES = (10, 20, 20, 15, 15, 20)
+PENALTIES = (2, 3, 4, 3, 3, 4)
+
+# Character sets used by the line-based formatting check
+_COMMENT_START = frozenset(('//', '/*'))
+_INDENT_OK = frozenset(' \t}])*')
+_STMT_SKIP = frozenset('*}{')
+_STMT_END = frozenset(';{}:([,')
+
+# Context in which a '/' starts a regex literal rather than a division
+_REGEX_PRECEDERS = frozenset('(,=:[!&|?{;+-*%~^\n')
+_REGEX_KEYWORDS = frozenset(('return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete',
+                             'void', 'throw', 'case', 'do', 'else', 'yield', 'await'))
 
 def analyze_javascript_code(code: str) -> Dict[str, Any]:
     """Analyze JavaScript/JSX code for clean code practices."""
-    # Initialize scores
-    scores = {
-        "naming": 10,
-        "modularity": 20,
-        "comments": 20,
-        "formatting": 15,
-        "reusability": 15,
-        "best_practices": 20
-    }
-    
-    recommendations = []
-    
-    # Check naming conventions
-    naming_issues = check_js_naming(code)
-    if naming_issues:
-        scores["naming"] = max(0, scores["naming"] - len(naming_issues) * 2)
-        recommendations.extend(naming_issues)
-    
-    # Check function length and modularity
-    modularity_issues = check_js_function_length(code)
-    if modularity_issues:
-        scores["modularity"] = max(0, scores["modularity"] - len(modularity_issues) * 3)
-        recommendations.extend(modularity_issues)
+    # One check per category, in the same order as CATEGORIES
+    checks = (
+        check_js_naming,
+        check_js_function_length,
+        check_js_comments,
+        check_js_formatting,
+        check_js_reusability,
+        check_js_best_practices,
+    )
+    issues = [list(islice(check(code), MAX_ISSUES)) for check in checks]
     
-    # Check comments and documentation
-    comment_issues = check_js_comments(code)
-    if comment_issues:
-        scores["comments"] = max(0, scores["comments"] - len(comment_issues) * 4)
-        recommendations.extend(comment_issues)
-    
-    # Check formatting
-    formatting_issues = check_js_formatting(code)
-    if formatting_issues:
-        scores["formatting"] = max(0, scores["formatting"] - len(formatting_issues) * 3)
-        recommendations.extend(formatting_issues)
-    
-    # Check reusability and DRY
-    reusability_issues = check_js_reusability(code)
-    if reusability_issues:
-        scores["reusability"] = max(0, scores["reusability"] - len(reusability_issues) * 3)
-        recommendations.extend(reusability_issues)
-    
-    # Check best practices
-    best_practice_issues = check_js_best_practices(code)
-    if best_practice_issues:
-        scores["best_practices"] = max(0, scores["best_practices"] - len(best_practice_issues) * 4)
-        recommendations.extend(best_practice_issues)
-    
-    # Calculate overall score
-    overall_score = sum(scores.values())
+    # Each category starts at its base score and loses a fixed penalty per issue
+    scores = tuple(
+        max(0, base - len(found) * penalty)
+        for base, found, penalty in zip(BASE_SCORES, issues, PENALTIES)
+    )
+    recommendations = [issue for found in issues for issue in found]
     
     return {
-        "overall_score": overall_score,
-        "breakdown": scores,
+        "overall_score": sum(scores),
+        "breakdown": dict(zip(CATEGORIES, scores)),
         "recommendations": recommendations[:5]  # Return top 5 recommendations
     }
 
-def check_js_naming(code: str) -> List[str]:
+def _is_camel(name: str) -> bool:
+    """Return True if name is camelCase, i.e. matches [a-z][a-zA-Z0-9]*."""
+    return name.isascii() and name.isalnum() and name[0].islower()
+
+def _is_pascal(name: str) -> bool:
+    """Return True if name is PascalCase, i.e. matches [A-Z][a-zA-Z0-9]*."""
+    return name.isascii() and name.isalnum() and name[0].isupper()
+
+def check_js_naming(code: str) -> Iterator[str]:
     """Check JavaScript naming conventions."""
-    issues = []
-    
     # Function names should be camelCase
-    function_pattern = r'function\s+([A-Za-z_][A-Za-z0-9_]*)\s*\('
-    for match in re.finditer(function_pattern, code):
+    for match in _FUNC_DEF.finditer(code):
         func_name = match.group(1)
-        if not re.fullmatch(r'[a-z][a-zA-Z0-9]*', func_name):
-            issues.append(f"Function '{func_name}' should use camelCase naming convention.")
+        if not _is_camel(func_name):
+            yield f"Function '{func_name}' should use camelCase naming convention."
     
     # Component names should be PascalCase
-    component_pattern = r'const\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\(?\{\s*\)?\s*=>'
-    for match in re.finditer(component_pattern, code):
+    for match in _COMPONENT.finditer(code):
         component_name = match.group(1)
-        if not re.fullmatch(r'[A-Z][a-zA-Z0-9]*', component_name):
-            issues.append(f"React component '{component_name}' should use PascalCase naming convention.")
+        if not _is_pascal(component_name):
+            yield f"React component '{component_name}' should use PascalCase naming convention."
     
     # Variable names should be camelCase
-    variable_pattern = r'(?:const|let|var)\s+([A-Za-z_][A-Za-z0-9_]*)'
-    for match in re.finditer(variable_pattern, code):
+    for match in _VAR_DECL.finditer(code):
         var_name = match.group(1)
-        if var_name != var_name.upper() and not re.fullmatch(r'[a-z][a-zA-Z0-9]*', var_name):
-            issues.append(f"Variable '{var_name}' should use camelCase naming convention.")
-    
-    return issues
+        if var_name != var_name.upper() and not _is_camel(var_name):
+            yield f"Variable '{var_name}' should use camelCase naming convention."
+
+def _starts_regex(code: str, i: int) -> bool:
+    """Return True if the '/' at index i is in a position where a regex literal can start."""
+    j = i - 1
+    while j >= 0 and code[j] in ' \t':
+        j -= 1
+    if j < 0 or code[j] in _REGEX_PRECEDERS:
+        return True
+    end = j + 1
+    while j >= 0 and (code[j].isalnum() or code[j] in '_$'):
+        j -= 1
+    return code[j + 1:end] in _REGEX_KEYWORDS
 
-def check_js_function_length(code: str) -> List[str]:
+def _regex_end(code: str, i: int) -> int:
+    """Return the index of the '/' closing the regex literal opened at i, or -1."""
+    in_class = False
+    j = i + 1
+    n = len(code)
+    while j < n:
+        ch = code[j]
+        if ch == '\\':
+            j += 1
+        elif ch == '\n':
+            return -1
+        elif in_class:
+            in_class = ch != ']'
+        elif ch == '[':
+            in_class = True
+        elif ch == '/':
+            return j
+        j += 1
+    return -1
+
+def _match_braces(code: str) -> Dict[int, int]:
+    """Map the position of each '{' to its matching '}' in a single pass.
+
+    String literals, comments and regex literals are skipped so braces inside them
+    are ignored. A '/' counts as a regex literal when it follows an operator,
+    an opening bracket or a keyword such as 'return'. After '<', '>' or '}' it is
+    treated as division or JSX text, so closing tags and text like {done}/{total}
+    are not misread. A quote directly after a letter or digit is treated as text,
+    as in the JSX "Don't". Any other lone quote in JSX text still opens a string
+    that runs to the end of its line. Unclosed braces are left out of the result.
+    """
+    pairs = {}
+    stack = []
+    i = 0
+    n = len(code)
+    no_regex_until = -1
+    while i < n:
+        ch = code[i]
+        if ch == '{':
+            stack.append(i)
+        elif ch == '}':
+            if stack:
+                pairs[stack.pop()] = i
+        elif ch == '/' and code.startswith('//', i):
+            i = code.find('\n', i)
+            if i == -1:
+                break
+        elif ch == '/' and code.startswith('/*', i):
+            i = code.find('*/', i + 2)
+            if i == -1:
+                break
+            i += 1
+        elif ch == '/' and i > no_regex_until and _starts_regex(code, i):
+            end = _regex_end(code, i)
+            if end != -1:
+                i = end
+            else:
+                # Unterminated on this line; don't rescan it for every later '/'
+                line_end = code.find('\n', i)
+                no_regex_until = n if line_end == -1 else line_end
+        elif ch in '"\'' and i and code[i - 1].isalnum():
+            # An apostrophe inside a word (JSX text such as Don't), not a string
+            pass
+        elif ch in '"\'`':
+            # Plain quotes cannot span lines, template literals can
+            i += 1
+            while i < n and code[i] != ch and (ch == '`' or code[i] != '\n'):
+                i += 2 if code[i] == '\\' else 1
+        i += 1
+    return pairs
+
+def _skip_ws(code: str, i: int) -> int:
+    """Return the index of the first non-whitespace character at or after i."""
+    n = len(code)
+    while i < n and code[i].isspace():
+        i += 1
+    return i
+
+def _iter_js_functions(code: str):
+    """Yield (name, body) for function declarations and arrow functions with a block body."""
+    pairs = None
+    for pattern, arrow in ((_FUNC_DEF, False), (_ARROW, True)):
+        close = -1
+        for match in pattern.finditer(code):
+            # Reuse the last ')' found so unclosed parameter lists stay linear
+            if close < match.end():
+                close = code.find(')', match.end())
+                if close == -1:
+                    break
+            i = _skip_ws(code, close + 1)
+            if arrow:
+                if not code.startswith('=>', i):
+                    continue
+                i = _skip_ws(code, i + 2)
+            if not code.startswith('{', i):
+                continue
+            if pairs is None:
+                pairs = _match_braces(code)
+            end = pairs.get(i)
+            if end is not None:
+                yield match.group(1), code[i + 1:end]
+
+def check_js_function_length(code: str) -> Iterator[str]:
     """Check for overly long functions in JavaScript."""
-    issues = []
-    function_pattern = r'function\s+([A-Za-z_][A-Za-z0-9_]*)\s*\([^)]*\)\s*\{([^}]*)\}'
-    
-    for match in re.finditer(function_pattern, code, re.DOTALL):
-        func_name = match.group(1)
-        body = match.group(2)
+    # Covers both function declarations and arrow functions
+    for func_name, body in _iter_js_functions(code):
         lines = body.count('\n') + 1
         if lines > 20:
-            issues.append(f"Function '{func_name}' is too long ({lines} lines). Consider refactoring into smaller functions.")
+            yield f"Function '{func_name}' is too long ({lines} lines). Consider refactoring into smaller functions."
         elif lines > 15:
-            issues.append(f"Function '{func_name}' is somewhat long ({lines} lines). Consider if it can be broken down.")
-    
-    # Check arrow functions
-    arrow_pattern = r'const\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\([^)]*\)\s*=>\s*\{([^}]*)\}'
-    for match in re.finditer(arrow_pattern, code, re.DOTALL):
-        func_name = match.group(1)
-        body = match.group(2)
-        lines = body.count('\n') + 1
-        if lines > 20:
-            issues.append(f"Function '{func_name}' is too long ({lines} lines). Consider refactoring into smaller functions.")
-        elif lines > 15:
-            issues.append(f"Function '{func_name}' is somewhat long ({lines} lines). Consider if it can be broken down.")
-    
-    return issues
+            yield f"Function '{func_name}' is somewhat long ({lines} lines). Consider if it can be broken down."
 
-def check_js_comments(code: str) -> List[str]:
+def check_js_comments(code: str) -> Iterator[str]:
     """Check for comments and documentation in JavaScript."""
-    issues = []
+    # Locate the end of every /** ... */ block once
+    jsdoc_ends = []
+    pos = code.find('/**')
+    while pos != -1:
+        end = code.find('*/', pos + 3)
+        if end == -1:
+            break
+        jsdoc_ends.append(end + 2)
+        pos = code.find('/**', end + 2)
     
     # Check for JSDoc comments on functions
-    function_pattern = r'function\s+([A-Za-z_][A-Za-z0-9_]*)\s*\('
-    for match in re.finditer(function_pattern, code):
+    for match in _FUNC_DEF.finditer(code):
         func_name = match.group(1)
         # Look for /** ... */ before the function
-        preceding_code = code[:match.start()]
-        if not re.search(r'/\*\*.*?\*/', preceding_code, re.DOTALL):
-            issues.append(f"Add JSDoc documentation for function '{func_name}'.")
+        if bisect.bisect_right(jsdoc_ends, match.start()) == 0:
+            yield f"Add JSDoc documentation for function '{func_name}'."
     
-    # Check for commented code
-    commented_code = re.findall(r'//\s*[^\s]', code)
-    if len(commented_code) > 5:  # Arbitrary threshold
-        issues.append("Avoid excessive single-line comments. Use them sparingly for important notes.")
-    
-    return issues
+    # Check for commented code, stopping as soon as the threshold is passed
+    count = 0
+    for _ in _COMMENTED.finditer(code):
+        count += 1
+        if count > 5:  # Arbitrary threshold
+            break
+    if count > 5:
+        yield "Avoid excessive single-line comments. Use them sparingly for important notes."
 
-def check_js_formatting(code: str) -> List[str]:
+def check_js_formatting(code: str) -> Iterator[str]:
     """Check basic JavaScript formatting issues."""
-    issues = []
-    lines = code.split('\n')
-    
-    # Check indentation (simple check)
-    for i, line in enumerate(lines, 1):
-        if line.strip() and not line.startswith((' ', '\t', '}', ']', ')', '//', '/*', '*')):
-            issues.append(f"Line {i}: Possible indentation issue detected.")
+    # Indentation issues are reported first, so only line numbers are kept for semicolons
+    semicolon_lines = []
     
-    # Check semicolons (optional in JS but can be enforced)
-    for i, line in enumerate(lines, 1):
+    for i, line in enumerate(code.split('\n'), 1):
         stripped = line.strip()
-        if stripped and not stripped.startswith(('//', '/*', '*', '}', '{')) and not stripped.endswith((';', '{', '}', ':', '(', '[', ',')):
-            issues.append(f"Line {i}: Consider adding a semicolon at the end of the statement.")
+        if not stripped:
+            continue
+        
+        # Check indentation (simple check)
+        if line[0] not in _INDENT_OK and line[:2] not in _COMMENT_START:
+            yield f"Line {i}: Possible indentation issue detected."
+        
+        # Check semicolons (optional in JS but can be enforced)
+        if stripped[0] not in _STMT_SKIP and stripped[:2] not in _COMMENT_START and stripped[-1] not in _STMT_END:
+            semicolon_lines.append(i)
     
-    return issues
+    for i in semicolon_lines:
+        yield f"Line {i}: Consider adding a semicolon at the end of the statement."
 
-def check_js_reusability(code: str) -> List[str]:
+def check_js_reusability(code: str) -> Iterator[str]:
     """Check for code duplication in JavaScript."""
-    issues = []
     # This is a simplified check - a real implementation would need more sophisticated analysis
     
-    # Look for repeated code blocks
-    lines = [line.strip() for line in code.split('\n') if line.strip()]
-    line_counts = {}
-    for line in lines:
-        if len(line) > 20:  # Only consider significant lines
-            line_counts[line] = line_counts.get(line, 0) + 1
+    # Look for repeated code blocks, only considering significant lines
+    line_counts = Counter(line for line in map(str.strip, code.split('\n')) if len(line) > 20)
     
     for line, count in line_counts.items():
         if count > 3:
-            issues.append(f"Similar code appears {count} times. Consider refactoring into a reusable function.")
-    
-    return issues
+            yield f"Similar code appears {count} times. Consider refactoring into a reusable function."
+
+def _has_var_keyword(code: str) -> bool:
+    """Return True if code contains 'var' as a whole word followed by whitespace."""
+    pos = code.find('var')
+    while pos != -1:
+        before = code[pos - 1] if pos else ' '
+        if code[pos + 3:pos + 4].isspace() and not (before.isalnum() or before == '_'):
+            return True
+        pos = code.find('var', pos + 3)
+    return False
 
-def check_js_best_practices(code: str) -> List[str]:
+def check_js_best_practices(code: str) -> Iterator[str]:
     """Check for JavaScript best practice violations."""
-    issues = []
-    
     # Check for == instead of ===
     if ' == ' in code:
-        issues.append("Use strict equality (===) instead of loose equality (==) to avoid type coercion.")
+        yield "Use strict equality (===) instead of loose equality (==) to avoid type coercion."
     
     # Check for var instead of const/let
-    if re.search(r'\bvar\s+', code):
-        issues.append("Prefer 'const' or 'let' over 'var' for variable declarations.")
+    if _has_var_keyword(code):
+        yield "Prefer 'const' or 'let' over 'var' for variable declarations."
     
     # Check for console.log left in code
     if 'console.log' in code:
-        issues.append("Remove or comment out 'console.log' statements before committing.")
+        yield "Remove or comment out 'console.log' statements before committing."
     
     # Check for React key prop in lists
     if 'map(' in code and 'key={' not in code:
-        issues.append("When rendering lists in React, provide a unique 'key' prop to each child.")
-    
-    return issues
\ No newline at end of file
+        yield "When rendering lists in React, provide a unique 'key' prop to each child."
@@ -1,6 +1,16 @@
 import ast
-import re
-from typing import List, Dict, Any
+import hashlib
+from itertools import islice
+from typing import List, Dict, Any, Iterator
+
+from . import MAX_ISSUES
+
+# Built-in names that should not be shadowed by variables
+_RESERVED = frozenset({'sum', 'list', 'dict', 'str', 'int', 'file', 'id', 'type'})
+
+# Line prefixes used by the formatting check
+_PY_SKIP_PREFIX = (' ', '\t')
+_PY_TOPLEVEL = ('def ', 'class ', 'import ', 'from ')
 
 def analyze_python_code(code: str) -> Dict[str, Any]:
     """Analyze Python code for clean code practices."""
@@ -32,38 +42,42 @@ def analyze_python_code(code: str) -> Dict[str, Any]:
     
     recommendations = []
     
+    # Run all AST-based checks in a single traversal
+    analyzer = _Analyzer()
+    analyzer.visit(tree)
+    
     # Check naming conventions
-    naming_issues = check_python_naming(tree)
+    naming_issues = analyzer.naming_issues
     if naming_issues:
         scores["naming"] = max(0, scores["naming"] - len(naming_issues) * 2)
         recommendations.extend(naming_issues)
     
     # Check function length and modularity
-    modularity_issues = check_function_length(tree)
+    modularity_issues = analyzer.modularity_issues
     if modularity_issues:
         scores["modularity"] = max(0, scores["modularity"] - len(modularity_issues) * 3)
         recommendations.extend(modularity_issues)
     
     # Check comments and docstrings
-    comment_issues = check_comments_and_docstrings(tree)
+    comment_issues = analyzer.comment_issues
     if comment_issues:
         scores["comments"] = max(0, scores["comments"] - len(comment_issues) * 4)
         recommendations.extend(comment_issues)
     
     # Check formatting
-    formatting_issues = check_formatting(code)
+    formatting_issues = list(islice(check_formatting(code), MAX_ISSUES))
     if formatting_issues:
         scores["formatting"] = max(0, scores["formatting"] - len(formatting_issues) * 3)
         recommendations.extend(formatting_issues)
     
     # Check reusability and DRY
-    reusability_issues = check_reusability(tree)
+    reusability_issues = analyzer.reusability_issues
     if reusability_issues:
         scores["reusability"] = max(0, scores["reusability"] - len(reusability_issues) * 3)
         recommendations.extend(reusability_issues)
     
     # Check best practices
-    best_practice_issues = check_python_best_practices(tree, code)
+    best_practice_issues = analyzer.best_practice_issues
     if best_practice_issues:
         scores["best_practices"] = max(0, scores["best_practices"] - len(best_practice_issues) * 4)
         recommendations.extend(best_practice_issues)
@@ -77,128 +91,149 @@ def analyze_python_code(code: str) -> Dict[str, Any]:
         "recommendations": recommendations[:5]  # Return top 5 recommendations
     }
 
-def check_python_naming(tree) -> List[str]:
-    """Check for Python naming convention violations."""
-    issues = []
-    reserved_words = {'sum', 'list', 'dict', 'str', 'int', 'file', 'id', 'type'}
-    
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            # Check function names (should be snake_case)
-            if not re.fullmatch(r'[a-z_][a-z0-9_]*', node.name):
-                issues.append(f"Function '{node.name}' should use snake_case naming convention.")
-            
-            # Check arguments (should be snake_case)
-            for arg in node.args.args:
-                if not re.fullmatch(r'[a-z_][a-z0-9_]*', arg.arg):
-                    issues.append(f"Argument '{arg.arg}' should use snake_case naming convention.")
+def _is_snake(name: str) -> bool:
+    """Return True if name is snake_case, i.e. matches [a-z_][a-z0-9_]*."""
+    if not name or name[0].isdigit() or not name.isascii():
+        return False
+    rest = name.replace('_', '')
+    return not rest or (rest.isalnum() and (rest.islower() or rest.isdigit()))
+
+def _body_digest(body: List[ast.stmt]) -> bytes:
+    """Return a compact digest of a function body's structure, ignoring positions.
+
+    Nodes are serialized iteratively (type name, then fields in order) so deeply nested
+    expressions cannot hit the recursion limit the way ast.dump can.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    stack = [body]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ast.AST):
+            digest.update(type(item).__name__.encode() + b'(')
+            stack.extend(reversed([getattr(item, field, None) for field in item._fields]))
+        elif isinstance(item, list):
+            digest.update(b'[%d;' % len(item))
+            stack.extend(reversed(item))
+        else:
+            digest.update(repr(item).encode() + b',')
+    return digest.digest()
+
+class _Analyzer:
+    """Collect naming, modularity, comment, reusability and best-practice issues in one pass."""
+    
+    def __init__(self):
+        self.naming_issues = []
+        self.modularity_issues = []
+        self.comment_issues = []
+        self.reusability_issues = []
+        self.best_practice_issues = []
+        self.function_bodies = {}
+    
+    def visit(self, tree: ast.AST) -> None:
+        """Visit every node depth-first, calling the matching visit_* method if any.
+
+        An explicit stack is used instead of ast.NodeVisitor's recursion, so deeply
+        nested expressions that ast.parse accepts cannot raise RecursionError.
+        """
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            method = getattr(self, 'visit_' + type(node).__name__, None)
+            if method is not None:
+                method(node)
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+    
+    def _report(self, issues: List[str], message: str) -> None:
+        """Record an issue unless its category already holds MAX_ISSUES."""
+        if len(issues) < MAX_ISSUES:
+            issues.append(message)
+    
+    def visit_FunctionDef(self, node):
+        # Check function names (should be snake_case)
+        if not _is_snake(node.name):
+            self._report(self.naming_issues, f"Function '{node.name}' should use snake_case naming convention.")
+        
+        # Check arguments (should be snake_case)
+        for arg in node.args.args:
+            if not _is_snake(arg.arg):
+                self._report(self.naming_issues, f"Argument '{arg.arg}' should use snake_case naming convention.")
+        
+        # Count source lines spanned by the function, not just its top-level statements
+        lines = node.end_lineno - node.lineno + 1
+        if lines > 20:
+            self._report(self.modularity_issues, f"Function '{node.name}' is too long ({lines} lines). Consider refactoring into smaller functions.")
+        elif lines > 15:
+            self._report(self.modularity_issues, f"Function '{node.name}' is somewhat long ({lines} lines). Consider if it can be broken down.")
+        
+        # Check for docstring
+        if not ast.get_docstring(node):
+            self._report(self.comment_issues, f"Add a docstring to function '{node.name}' to explain its purpose.")
+        
+        # Simple check for duplicate code (would need more sophisticated analysis in a real tool)
+        body_hash = _body_digest(node.body)
+        if body_hash in self.function_bodies:
+            self._report(self.reusability_issues, f"Function '{node.name}' has similar code to '{self.function_bodies[body_hash]}'. Consider refactoring to avoid duplication.")
+        else:
+            self.function_bodies[body_hash] = node.name
         
-        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+        # Check for mutable default arguments
+        for default in node.args.defaults:
+            if isinstance(default, (ast.List, ast.Dict, ast.Set)):
+                self._report(self.best_practice_issues, f"Function '{node.name}' uses mutable default argument. This can lead to unexpected behavior.")
+    
+    def visit_ClassDef(self, node):
+        # Check for docstring
+        if not ast.get_docstring(node):
+            self._report(self.comment_issues, f"Add a docstring to class '{node.name}' to explain its purpose.")
+    
+    def visit_Name(self, node):
+        # Exact type check; ctx is always a plain Load/Store/Del instance
+        if type(node.ctx) is ast.Store:
             # Check variable names (should be snake_case)
-            if not re.fullmatch(r'[a-z_][a-z0-9_]*', node.id):
-                issues.append(f"Variable '{node.id}' should use snake_case naming convention.")
+            if not _is_snake(node.id):
+                self._report(self.naming_issues, f"Variable '{node.id}' should use snake_case naming convention.")
             
             # Check for reserved words
-            if node.id in reserved_words:
-                issues.append(f"Avoid using '{node.id}' as a variable name—it's a Python built-in.")
-    
-    return issues
-
-def check_function_length(tree) -> List[str]:
-    """Check for overly long functions."""
-    issues = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            # Count lines in function body
-            lines = len(node.body)
-            if lines > 20:
-                issues.append(f"Function '{node.name}' is too long ({lines} lines). Consider refactoring into smaller functions.")
-            elif lines > 15:
-                issues.append(f"Function '{node.name}' is somewhat long ({lines} lines). Consider if it can be broken down.")
-    
-    return issues
-
-def check_comments_and_docstrings(tree) -> List[str]:
-    """Check for missing docstrings and comments."""
-    issues = []
-    
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-            # Check for docstring
-            docstring = ast.get_docstring(node)
-            if not docstring:
-                if isinstance(node, ast.FunctionDef):
-                    issues.append(f"Add a docstring to function '{node.name}' to explain its purpose.")
-                elif isinstance(node, ast.ClassDef):
-                    issues.append(f"Add a docstring to class '{node.name}' to explain its purpose.")
-    
-    # Check for commented code (bad practice)
-    # This would require the raw code, so handled in check_formatting
-    
-    return issues
+            if node.id in _RESERVED:
+                self._report(self.naming_issues, f"Avoid using '{node.id}' as a variable name—it's a Python built-in.")
+    
+    def visit_ExceptHandler(self, node):
+        # Check for use of bare except
+        if node.type is None:
+            self._report(self.best_practice_issues, "Avoid bare 'except:' clauses. Specify the exception type.")
+    
+    def visit_Compare(self, node):
+        # Check for use of == None (should use is None)
+        for op in node.ops:
+            if isinstance(op, ast.Eq):
+                if isinstance(node.comparators[0], ast.Constant) and node.comparators[0].value is None:
+                    self._report(self.best_practice_issues, "Use 'is None' instead of '== None' for None comparisons.")
 
-def check_formatting(code: str) -> List[str]:
+def check_formatting(code: str) -> Iterator[str]:
     """Check basic formatting issues."""
-    issues = []
-    lines = code.split('\n')
-    
-    # Check for inconsistent indentation
-    for i, line in enumerate(lines, 1):
-        if line.strip() and not line.startswith((' ', '\t')) and not line.startswith(('def ', 'class ', 'import ', 'from ')):
-            issues.append(f"Line {i}: Inconsistent indentation detected.")
-    
-    # Check for trailing whitespace
-    for i, line in enumerate(lines, 1):
-        if line.rstrip() != line:
-            issues.append(f"Line {i}: Trailing whitespace detected.")
-    
-    # Check for commented code
-    for i, line in enumerate(lines, 1):
+    # Whitespace and comment issues follow the indentation ones
+    whitespace_lines = []
+    comment_lines = []
+    
+    for i, line in enumerate(code.split('\n'), 1):
+        # Check for trailing whitespace
+        if line[-1:].isspace():
+            whitespace_lines.append(i)
+        
         stripped = line.strip()
-        if stripped.startswith('#') and len(stripped) > 1 and not stripped[1].isspace():
+        if not stripped:
+            continue
+        
+        # Check for inconsistent indentation
+        if not line.startswith(_PY_SKIP_PREFIX) and not line.startswith(_PY_TOPLEVEL):
+            yield f"Line {i}: Inconsistent indentation detected."
+        
+        # Check for commented code
+        if stripped[0] == '#' and len(stripped) > 1 and not stripped[1].isspace():
             # This is a simple check that might have false positives
-            issues.append(f"Line {i}: Avoid commented-out code. Remove or explain with proper comments.")
+            comment_lines.append(i)
     
-    return issues
-
-def check_reusability(tree) -> List[str]:
-    """Check for code duplication and reusability issues."""
-    issues = []
-    functions = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-    
-    # Simple check for duplicate code (would need more sophisticated analysis in a real tool)
-    function_bodies = {}
-    for func in functions:
-        body_str = ast.dump(func.body)
-        if body_str in function_bodies:
-            issues.append(f"Function '{func.name}' has similar code to '{function_bodies[body_str]}'. Consider refactoring to avoid duplication.")
-        else:
-            function_bodies[body_str] = func.name
-    
-    return issues
-
-def check_python_best_practices(tree, code: str) -> List[str]:
-    """Check for Python best practice violations."""
-    issues = []
-    
-    # Check for use of bare except
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ExceptHandler) and node.type is None:
-            issues.append("Avoid bare 'except:' clauses. Specify the exception type.")
-    
-    # Check for mutable default arguments
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            for default in node.args.defaults:
-                if isinstance(default, (ast.List, ast.Dict, ast.Set)):
-                    issues.append(f"Function '{node.name}' uses mutable default argument. This can lead to unexpected behavior.")
-    
-    # Check for use of == None (should use is None)
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Compare):
-            for op in node.ops:
-                if isinstance(op, ast.Eq):
-                    if isinstance(node.comparators[0], ast.Constant) and node.comparators[0].value is None:
-                        issues.append("Use 'is None' instead of '== None' for None comparisons.")
-    
-    return issues
\ No newline at end of file
+    for i in whitespace_lines:
+        yield f"Line {i}: Trailing whitespace detected."
+    for i in comment_lines:
+        yield f"Line {i}: Avoid commented-out code. Remove or explain with proper comments."
@@ -1,10 +1,28 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import hashlib
 import os
 from analyzers.python_analyzer import analyze_python_code
 from analyzers.javascript_analyzer import analyze_javascript_code
 
+# Upload limits
+MAX_BYTES = 2_000_000
+CHUNK_SIZE = 65536
+
+# Recently analyzed sources, keyed on analyzer name and source digest
+CACHE_SIZE = 256
+_result_cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+
+# Analyzer to use for each supported file extension
+ANALYZERS = {
+    ".py": analyze_python_code,
+    ".js": analyze_javascript_code,
+    ".jsx": analyze_javascript_code,
+}
+
 app = FastAPI()
 
 # CORS configuration
@@ -15,21 +33,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+async def analyze_cached(analyzer: Callable[[str], Dict[str, Any]], code: str) -> Dict[str, Any]:
+    """Run analyzer on code, reusing the result for recently seen sources.
+
+    The analyzer runs in a worker thread so it does not block the event loop. The cache
+    itself is only touched from the event loop, so it needs no locking.
+    """
+    key = (analyzer.__name__, hashlib.blake2b(code.encode(), digest_size=16).digest())
+    result = _result_cache.get(key)
+    if result is not None:
+        _result_cache.move_to_end(key)
+        return result
+    
+    result = await asyncio.to_thread(analyzer, code)
+    _result_cache[key] = result
+    if len(_result_cache) > CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    return result
+
 @app.post("/analyze-code")
 async def analyze_code(file: UploadFile = File(...)):
     try:
-        contents = await file.read()
-        code = contents.decode("utf-8")
-        filename = file.filename.lower()
-        
-        if filename.endswith(('.py')):
-            return analyze_python_code(code)
-        elif filename.endswith(('.js', '.jsx')):
-            return analyze_javascript_code(code)
-        else:
+        ext = os.path.splitext((file.filename or "").lower())[1]
+        analyzer = ANALYZERS.get(ext)
+        if analyzer is None:
             raise HTTPException(
                 status_code=400,
                 detail="Unsupported file type. Please upload a .py, .js, or .jsx file."
             )
+        
+        # Read the upload in chunks so oversized files are rejected early
+        size = 0
+        chunks = []
+        while True:
+            chunk = await file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > MAX_BYTES:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {MAX_BYTES} bytes."
+                )
+            chunks.append(chunk)
+        code = b"".join(chunks).decode("utf-8", errors="replace")
+        return await analyze_cached(analyzer, code)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app imports its analyzers as a top-level package, as when run from backend/app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
@@ -0,0 +1,102 @@
+from analyzers.javascript_analyzer import _match_braces, check_js_function_length
+
+
+def long_function(line: str) -> str:
+    """Build a 22-line function whose body repeats the given line."""
+    return "function longFunction() {\n" + f"  {line}\n" * 20 + "}\n"
+
+
+def list_issues(code: str):
+    return list(check_js_function_length(code))
+
+
+def test_match_braces_nested():
+    code = "{ a { b { c } } }"
+    assert _match_braces(code) == {0: 16, 4: 14, 8: 12}
+
+
+def test_match_braces_ignores_strings():
+    code = "{ x = '}'; y = \"{\"; }"
+    assert _match_braces(code) == {0: 20}
+
+
+def test_match_braces_plain_quote_ends_at_newline():
+    # An unterminated quote (e.g. an apostrophe in JSX text) must not swallow later lines
+    code = "{ <p>Don't</p>\n}"
+    assert _match_braces(code) == {0: 15}
+
+
+def test_match_braces_ignores_template_literals():
+    code = "{ s = `a}\n{b`; }"
+    assert _match_braces(code) == {0: 15}
+
+
+def test_match_braces_ignores_comments():
+    code = "{ // }\n /* { */ }"
+    assert _match_braces(code) == {0: 16}
+
+
+def test_match_braces_skips_unclosed():
+    assert _match_braces("{ { }") == {2: 4}
+    assert _match_braces("} {") == {}
+
+
+def test_match_braces_ignores_regex_literals():
+    assert _match_braces("{ const r = /[{]/; }") == {0: 19}
+    assert _match_braces("{ return /}/.test(s); }") == {0: 22}
+
+
+def test_match_braces_treats_division_as_operator():
+    assert _match_braces("{ x = a / 2; y = b / 4; }") == {0: 24}
+    assert _match_braces("<p>{a}</p>{b}") == {3: 5, 10: 12}
+
+
+def test_match_braces_treats_slash_after_brace_as_jsx_text():
+    assert _match_braces("<p>{done}/{total}</p>") == {3: 8, 10: 16}
+
+
+def test_match_braces_apostrophe_in_jsx_text():
+    code = "<p>Don't miss {items.map(i => {\n  return i;\n})}</p>"
+    assert _match_braces(code) == {
+        code.index("{items"): code.index("}</p>"),
+        code.index("{\n"): code.index("})"),
+    }
+
+
+def test_function_length_counts_inner_blocks():
+    assert list_issues(long_function("if (x) { y(); }")) == [
+        "Function 'longFunction' is too long (22 lines). Consider refactoring into smaller functions."
+    ]
+
+
+def test_function_length_with_regex_literal():
+    assert list_issues(long_function("const r = /[{]/;")) == [
+        "Function 'longFunction' is too long (22 lines). Consider refactoring into smaller functions."
+    ]
+
+
+def test_function_length_arrow_function():
+    code = "const handleClick = (event) => {\n" + "  step();\n" * 16 + "};\n"
+    assert list_issues(code) == [
+        "Function 'handleClick' is somewhat long (18 lines). Consider if it can be broken down."
+    ]
+
+
+def test_function_length_with_apostrophe_in_jsx_text():
+    code = (
+        "function App() {\n"
+        "  return (\n"
+        "    <p>Don't miss {items.map(i => {\n"
+        + "      step(i);\n" * 19
+        + "      return i;\n"
+        "    })}</p>\n"
+        "  );\n"
+        "}\n"
+    )
+    assert list_issues(code) == [
+        "Function 'App' is too long (26 lines). Consider refactoring into smaller functions."
+    ]
+
+
+def test_function_length_unclosed_body():
+    assert list_issues("function broken() {\n" + "  x;\n" * 30) == []
@@ -0,0 +1,108 @@
+import ast
+
+from analyzers.python_analyzer import _body_digest, analyze_python_code
+
+
+def test_deep_expression_does_not_recurse():
+    result = analyze_python_code('x = ' + '1+' * 500 + '1\n')
+    assert result["breakdown"]["naming"] == 10
+    assert result["overall_score"] > 0
+
+
+def test_deep_expression_in_function_bodies():
+    body = '    """Add things."""\n    return ' + '1+' * 500 + '1\n'
+    code = 'def first():\n' + body + '\n\ndef second():\n' + body
+    result = analyze_python_code(code)
+    assert result["recommendations"] == [
+        "Function 'second' has similar code to 'first'. Consider refactoring to avoid duplication."
+    ]
+
+
+def test_body_digest_ignores_positions_but_not_values():
+    first = ast.parse('def f():\n    return x + 1\n').body[0].body
+    moved = ast.parse('\n\ndef g():\n        return x + 1\n').body[0].body
+    other = ast.parse('def h():\n    return x + 2\n').body[0].body
+    assert _body_digest(first) == _body_digest(moved)
+    assert _body_digest(first) != _body_digest(other)
+
+
+def test_sample_with_functions():
+    code = (
+        'def CalculateTotal(orders):\n'
+        '    sum = 0\n'
+        '    for i in orders:\n'
+        '        sum += i["value"]\n'
+        '    return sum\n'
+    )
+    result = analyze_python_code(code)
+    assert result["recommendations"] == [
+        "Function 'CalculateTotal' should use snake_case naming convention.",
+        "Avoid using 'sum' as a variable name—it's a Python built-in.",
+        "Avoid using 'sum' as a variable name—it's a Python built-in.",
+        "Add a docstring to function 'CalculateTotal' to explain its purpose.",
+    ]
+    assert result["breakdown"]["naming"] == 4
+    assert result["breakdown"]["comments"] == 16
+
+
+def test_duplicate_function_bodies():
+    code = (
+        'def load(path):\n'
+        '    """Load a file."""\n'
+        '    return open(path).read()\n'
+        '\n'
+        'def read(path):\n'
+        '    """Load a file."""\n'
+        '    return open(path).read()\n'
+        '\n'
+        'def size(path):\n'
+        '    """Load a file."""\n'
+        '    return len(open(path).read())\n'
+    )
+    result = analyze_python_code(code)
+    assert result["recommendations"] == [
+        "Function 'read' has similar code to 'load'. Consider refactoring to avoid duplication."
+    ]
+    assert result["breakdown"]["reusability"] == 12
+
+
+def test_best_practice_issues():
+    code = (
+        'def check(value, seen=[]):\n'
+        '    """Check a value."""\n'
+        '    try:\n'
+        '        return value == None\n'
+        '    except:\n'
+        '        return False\n'
+    )
+    result = analyze_python_code(code)
+    assert result["recommendations"] == [
+        "Function 'check' uses mutable default argument. This can lead to unexpected behavior.",
+        "Use 'is None' instead of '== None' for None comparisons.",
+        "Avoid bare 'except:' clauses. Specify the exception type.",
+    ]
+    assert result["breakdown"]["best_practices"] == 8
+
+
+def nested_function(lines: int) -> str:
+    """Build a function spanning the given number of lines, all inside one if block."""
+    return 'def process(items):\n    """Process items."""\n    if items:\n' + '        step()\n' * (lines - 3)
+
+
+def test_long_nested_function_is_too_long():
+    result = analyze_python_code(nested_function(21))
+    assert result["recommendations"] == [
+        "Function 'process' is too long (21 lines). Consider refactoring into smaller functions."
+    ]
+    assert result["breakdown"]["modularity"] == 17
+
+
+def test_nested_function_is_somewhat_long():
+    result = analyze_python_code(nested_function(17))
+    assert result["recommendations"] == [
+        "Function 'process' is somewhat long (17 lines). Consider if it can be broken down."
+    ]
+
+
+def test_short_nested_function_is_not_flagged():
+    assert analyze_python_code(nested_function(15))["recommendations"] == []